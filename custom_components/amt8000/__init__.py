@@ -1,20 +1,33 @@
 """The AMT-8000 integration."""
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
 import logging
-from typing import Any
+from typing import Any, Mapping
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
 from .coordinator import AmtCoordinator
 from .isec2.client import Client as ISecClient, CommunicationError
 
 LOGGER = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class AmtEntryData:
+    """Runtime data stored in hass.data for each config entry."""
+
+    coordinator: AmtCoordinator
+    config: Mapping[str, Any]
+
+
 # Plataformas soportadas por la integración
 PLATFORMS: list[str] = ["alarm_control_panel", "sensor", "binary_sensor"] 
 
@@ -31,9 +44,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         LOGGER.error("Missing required configuration data")
         return False
     
-    # Inicializar el dominio en hass.data si no existe
-    hass.data.setdefault(DOMAIN, {})
-    
     try:
         # Crear la instancia del cliente ISEC
         isec_client = ISecClient(
@@ -49,36 +59,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             config_entry=entry
         )
         
-        # Realizar la primera actualización para obtener datos iniciales
+        # Realizar la primera actualización para obtener datos iniciales;
+        # si falla, el coordinador ya lanza ConfigEntryNotReady
         LOGGER.info("Performing initial data refresh for AMT-8000")
-        try:
-            await coordinator.async_config_entry_first_refresh()
-        except Exception as err:
-            LOGGER.error("Failed to perform initial refresh: %s", err)
-            raise ConfigEntryNotReady(f"Failed to connect to AMT-8000: {err}") from err
+        await coordinator.async_config_entry_first_refresh()
         
         # Guardar el coordinador en hass.data
-        hass.data[DOMAIN][entry.entry_id] = {
-            "coordinator": coordinator,
-            "config": entry.data,
-        }
+        hass.data[DOMAIN][entry.entry_id] = AmtEntryData(
+            coordinator=coordinator,
+            config=entry.data,
+        )
         
         # Configurar las plataformas
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-        
-        # Registrar servicios personalizados
-        await _async_setup_services(hass, entry)
+
+        # Aplicar cambios de opciones sin recargar toda la integración
+        entry.async_on_unload(entry.add_update_listener(_async_options_updated))
         
         LOGGER.info("AMT-8000 integration setup completed successfully")
         return True
         
-    except CommunicationError as err:
+    except (CommunicationError, asyncio.TimeoutError) as err:
         LOGGER.error("Communication error during setup: %s", err)
         raise ConfigEntryNotReady(f"Cannot connect to AMT-8000 at {entry.data['host']}:{entry.data['port']}") from err
-        
-    except Exception as err:
-        LOGGER.error("Unexpected error during setup: %s", err)
-        return False
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
@@ -88,68 +91,42 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         # Limpiar datos almacenados
-        coordinator_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data: AmtEntryData | None = hass.data[DOMAIN].pop(entry.entry_id, None)
         
         # Limpiar el coordinador si existe
-        if coordinator_data and "coordinator" in coordinator_data:
-            coordinator = coordinator_data["coordinator"]
-            # Asegurar que se cierre la conexión
+        if entry_data is not None:
+            coordinator = entry_data.coordinator
+            # Asegurar que se cierre la conexión con el panel
             try:
-                if hasattr(coordinator, 'client') and coordinator.client:
-                    coordinator.client.close()
+                await coordinator.async_close()
             except Exception as err:
                 LOGGER.debug("Error closing client during unload: %s", err)
         
-        # Desregistrar servicios si no hay más entradas
-        if not hass.data[DOMAIN]:
-            await _async_unload_services(hass)
-        
         LOGGER.info("AMT-8000 integration unloaded successfully")
     
     return unload_ok
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
 
-async def _async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Set up services for AMT-8000."""
-    
-    async def async_refresh_zones(call: Any) -> None:
-        """Service to refresh paired zones."""
-        entry_id = call.data.get("entry_id")
-        if not entry_id:
-            # Si no se especifica entry_id, usar la primera entrada disponible
-            entries = [e for e in hass.config_entries.async_entries(DOMAIN)]
-            if entries:
-                entry_id = entries[0].entry_id
-            else:
-                LOGGER.error("No AMT-8000 entries found")
-                return
-        
-        coordinator_data = hass.data[DOMAIN].get(entry_id)
-        if not coordinator_data:
-            LOGGER.error("AMT-8000 entry not found: %s", entry_id)
-            return
-        
-        coordinator = coordinator_data["coordinator"]
-        await coordinator.async_refresh_zones()
-        LOGGER.info("Zones refresh completed for entry %s", entry_id)
-    
-    # Registrar el servicio solo si aún no existe
-    if not hass.services.has_service(DOMAIN, "refresh_zones"):
-        hass.services.async_register(
-            DOMAIN,
-            "refresh_zones",
-            async_refresh_zones,
-            schema=None,  # Podrías agregar un schema de validación aquí
-        )
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated options in place, reloading only on connection changes."""
+    entry_data: AmtEntryData | None = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is None:
+        return
+
+    stored = entry_data.config
+    if any(stored.get(key) != entry.data.get(key) for key in ("host", "port", "password")):
+        LOGGER.info("AMT-8000 connection settings changed, reloading entry")
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
 
-async def _async_unload_services(hass: HomeAssistant) -> None:
-    """Unload services when no entries remain."""
-    if hass.services.has_service(DOMAIN, "refresh_zones"):
-        hass.services.async_remove(DOMAIN, "refresh_zones")
+    coordinator = entry_data.coordinator
+    coordinator.update_interval = timedelta(
+        seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
+    LOGGER.debug("AMT-8000 update interval set to %s", coordinator.update_interval)
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry."""
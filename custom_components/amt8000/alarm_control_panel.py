@@ -1,13 +1,21 @@
 """Defines the sensors for amt-8000."""
-from datetime import timedelta
 import logging
-from typing import Any
+from operator import methodcaller
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.alarm_control_panel import AlarmControlPanelEntity, AlarmControlPanelEntityFeature
 from homeassistant.components.alarm_control_panel import CodeFormat
+from homeassistant.const import (
+    STATE_ALARM_ARMED_AWAY,
+    STATE_ALARM_ARMED_HOME,
+    STATE_ALARM_DISARMED,
+    STATE_ALARM_TRIGGERED,
+)
 
 
 from homeassistant.helpers.update_coordinator import (
@@ -16,15 +24,62 @@ from homeassistant.helpers.update_coordinator import (
 
 
 from .const import DOMAIN
-from .coordinator import AmtCoordinator
-from .isec2.client import Client as ISecClient
+from .coordinator import (
+    FLAG_ARMED,
+    FLAG_ARMED_STAY,
+    FLAG_DISARMED,
+    FLAG_IN_ALARM,
+    FLAG_PARTIALLY_ARMED,
+    AmtCoordinator,
+)
+from .isec2.client import ArmResult
 
 
 LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
-SCAN_INTERVAL = timedelta(seconds=10)
 
+# Acciones del panel: comando del cliente y respuesta que confirma la acción
+_ACTIONS = {
+    "disarm": (methodcaller("async_disarm_system", 0), ArmResult.DISARMED),
+    "arm away": (methodcaller("async_arm_system", 0), ArmResult.ARMED),
+    "trigger": (methodcaller("async_panic", 1), ArmResult.TRIGGERED),
+}
+
+# Flags del panel en orden de prioridad: el primero activo define el estado
+_STATE_PRIORITY = (
+    (FLAG_IN_ALARM, STATE_ALARM_TRIGGERED),
+    (FLAG_ARMED, STATE_ALARM_ARMED_AWAY),
+    (FLAG_PARTIALLY_ARMED, STATE_ALARM_ARMED_HOME),
+    (FLAG_ARMED_STAY, STATE_ALARM_ARMED_HOME),
+    (FLAG_DISARMED, STATE_ALARM_DISARMED),
+)
+
+
+def _state_for_flags(flags: int) -> str | None:
+    """Return the alarm state for a packed panel flags value."""
+    for flag, alarm_state in _STATE_PRIORITY:
+        if flags & flag:
+            return alarm_state
+    return None
+
+
+# Tabla precalculada: estado para cada combinación posible de flags
+_FLAG_TO_STATE = tuple(_state_for_flags(flags) for flags in range(FLAG_IN_ALARM << 1))
+
+# Claves del panel expuestas como atributos del estado: (clave, atributo)
+_ATTR_KEYS = (
+    ("model", "model"),
+    ("version", "version"),
+    ("zonesFiring", "zones_firing"),
+    ("zonesClosed", "zones_closed"),
+    ("siren", "siren_active"),
+    ("batteryStatus", "battery_status"),
+    ("tamper", "tamper_detected"),
+)
+
+# Atributos compartidos cuando todavía no hay datos del panel
+_NO_ATTRS: Mapping[str, Any] = MappingProxyType({})
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,12 +88,10 @@ async def async_setup_entry(
 ) -> None:
     """Set up the entries for amt-8000."""
     # Accedemos al coordinador que ya fue creado y guardado en hass.data por __init__.py
-    coordinator: AmtCoordinator = hass.data[DOMAIN][config_entry.entry_id]['coordinator']
-    isec_client = coordinator.isec_client # Obtenemos el cliente del coordinador
-    password = coordinator.password # Obtenemos la contraseña del coordinador
-    
+    coordinator: AmtCoordinator = hass.data[DOMAIN][config_entry.entry_id].coordinator
+
     LOGGER.info('setting up alarm control panel...')
-    sensors = [AmtAlarmPanel(coordinator, isec_client, password)]
+    sensors = [AmtAlarmPanel(coordinator)]
     async_add_entities(sensors)
 
 
@@ -53,154 +106,84 @@ class AmtAlarmPanel(CoordinatorEntity, AlarmControlPanelEntity):
     )
     
     _attr_has_entity_name = True
-    _attr_name = "Alarm Panel"
+    _attr_name = "AMT-8000"
+    _attr_unique_id = "amt8000.control_panel"
     _attr_code_format = CodeFormat.NUMBER
     _attr_code_arm_required = True
     
-    def __init__(self, coordinator, isec_client: ISecClient, password):
+    def __init__(self, coordinator: AmtCoordinator):
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self.status = None
-        self.isec_client = isec_client
-        self.password = password
-        self._is_on = False
+        self._written_key: tuple[Any, ...] | None = None
+        self._cached_attrs: Mapping[str, Any] = _NO_ATTRS
+        self._last_panel: Mapping[str, Any] | None = None
+        self._last_success: bool | None = None
+        self._update_state()
+        # Esta es la parte clave para agrupar las entidades bajo un dispositivo
+        self._attr_device_info = coordinator.device_info
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update the stored value on coordinator updates."""
-        self.status = self.coordinator.data
+        # Mismo objeto de datos y mismo resultado de la consulta: nada cambió
+        panel_data = self.coordinator.panel_data
+        success = self.coordinator.last_update_success
+        if panel_data is self._last_panel and success is self._last_success:
+            return
+        self._last_panel = panel_data
+        self._last_success = success
+
+        self._update_state()
+
+        # Evitar escribir el estado si nada visible cambió
+        key = (self._attr_state, self._attr_available, self._cached_attrs)
+        if key == self._written_key:
+            return
+        self._written_key = key
         self.async_write_ha_state()
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return "AMT-8000"
+    def _update_state(self) -> None:
+        """Map the panel flags from the coordinator to an alarm state."""
+        panel_data = self.coordinator.panel_data
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return "amt8000.control_panel"
+        self._attr_state = _FLAG_TO_STATE[panel_data.get("flags", 0)]
+        self._attr_available = (
+            bool(panel_data) and self.coordinator.last_update_success
+        )
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.status is not None and self.coordinator.last_update_success
-
-    @property
-    def state(self) -> str:
-        """Return the state of the entity."""
-        if self.status is None:
-            return "unknown"
-
-        if self.status.get('siren') is True:
-            return "triggered"
-
-        current_status = self.status.get("status")
-        if current_status and current_status.startswith("armed_"):
-          self._is_on = True
+        if panel_data:
+            self._cached_attrs = {
+                attr: panel_data.get(key) for key, attr in _ATTR_KEYS
+            }
         else:
-          self._is_on = False
+            self._cached_attrs = _NO_ATTRS
 
-        return current_status if current_status else "unknown"
+    @property
+    def available(self) -> bool:
+        """Return the availability computed on the last update."""
+        # CoordinatorEntity define su propio available, que oculta _attr_available
+        return self._attr_available
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return the state attributes."""
-        if self.status is None:
-            return None
-        
-        return {
-            "model": self.status.get("model", "unknown"),
-            "version": self.status.get("version", "unknown"),
-            "zones_firing": self.status.get("zonesFiring", False),
-            "zones_closed": self.status.get("zonesClosed", False),
-            "siren_active": self.status.get("siren", False),
-            "battery_status": self.status.get("batteryStatus", "unknown"),
-            "tamper_detected": self.status.get("tamper", False),
-        }
+        return self._cached_attrs
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        # Esta es la parte clave para agrupar las entidades bajo un dispositivo
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.config_entry.entry_id)}, # Identificador único para el dispositivo
-            "name": "AMT-8000 Alarm Panel", # Nombre del dispositivo
-            "manufacturer": "Intelbras",
-            "model": self.coordinator.data.get("model", "AMT-8000"),
-            "sw_version": self.coordinator.data.get("version", "Unknown"),
-        }
-
-    def _arm_away(self):
-        """Arm AMT in away mode"""
-        self.isec_client.connect()
-        self.isec_client.auth(self.password)
-        result = self.isec_client.arm_system(0)
-        self.isec_client.close()
-        if result == "armed":
-            return 'armed_away'
-
-    def _disarm(self):
-        """Arm AMT in away mode"""
-        self.isec_client.connect()
-        self.isec_client.auth(self.password)
-        result = self.isec_client.disarm_system(0)
-        self.isec_client.close()
-        if result == "disarmed":
-            return 'disarmed'
-
-
-    def _trigger_alarm(self):
-        """Trigger Alarm"""
-        self.isec_client.connect()
-        self.isec_client.auth(self.password)
-        result = self.isec_client.panic(1)
-        self.isec_client.close()
-        if result == "triggered":
-            return "triggered"
-
-
-    def alarm_disarm(self, code=None) -> None:
-        """Send disarm command."""
-        self._disarm()
+    async def _async_send(self, action: str) -> None:
+        """Send an action through the coordinator and check the panel reply."""
+        command, expected = _ACTIONS[action]
+        result = await self.coordinator.run_command(command)
+        if result is not expected:
+            raise HomeAssistantError(f"AMT-8000 did not confirm {action}")
 
     async def async_alarm_disarm(self, code=None) -> None:
         """Send disarm command."""
-        await self.hass.async_add_executor_job(self._disarm)
-
-    def alarm_arm_away(self, code=None) -> None:
-        """Send arm away command."""
-        self._arm_away()
+        await self._async_send("disarm")
 
     async def async_alarm_arm_away(self, code=None) -> None:
         """Send arm away command."""
-        await self.hass.async_add_executor_job(self._arm_away)
-
-    def alarm_trigger(self, code=None) -> None:
-        """Send alarm trigger command."""
-        self._trigger_alarm()
+        await self._async_send("arm away")
 
     async def async_alarm_trigger(self, code=None) -> None:
         """Send alarm trigger command."""
-        await self.hass.async_add_executor_job(self._trigger_alarm)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if entity is on."""
-        return self._is_on
-
-    def turn_on(self, **kwargs: Any) -> None:
-        self._arm_away()
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the entity on."""
-        await self.hass.async_add_executor_job(self._arm_away)
-
-    def turn_off(self, **kwargs: Any) -> None:
-        """Turn the entity off."""
-        self._disarm()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the entity off."""
-        await self.hass.async_add_executor_job(self._disarm)
-
+        await self._async_send("trigger")
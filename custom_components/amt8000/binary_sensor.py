@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
 import logging
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
@@ -23,6 +23,12 @@ LOGGER = logging.getLogger(__name__)
 # Ajusta este valor si sabes que tu panel tiene menos de 64 zonas.
 MAX_ZONES = 64 
 
+
+def _uid(entry_id: str, suffix: str) -> str:
+    """Build an entity unique id from the config entry id."""
+    return entry_id + suffix
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -30,189 +36,136 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensor platform."""
     # Accedemos al coordinador que ya fue creado y guardado en hass.data por __init__.py
-    coordinator: AmtCoordinator = hass.data[DOMAIN][config_entry.entry_id]['coordinator']
+    coordinator: AmtCoordinator = hass.data[DOMAIN][config_entry.entry_id].coordinator
     
     LOGGER.info('setting up binary sensor entities...')
-    entities: list[BinarySensorEntity] = [
-        AmtZonesClosedSensor(coordinator), # Entidad existente
-        AmtSirenSensor(coordinator),       # Entidad existente
-        AmtTamperSensor(coordinator),      # Entidad existente
-    ]
-
-    # AÑADIR LAS ENTIDADES DE ZONA INDIVIDUALES
-    for i in range(MAX_ZONES):
-        entities.append(AmtZoneBinarySensor(coordinator, i + 1)) # Las zonas suelen ser 1-indexadas
+    # Sensores del panel y una entidad por zona (las zonas suelen ser 1-indexadas)
+    entities: tuple[BinarySensorEntity, ...] = (
+        AmtZonesClosedSensor(coordinator),
+        AmtSirenSensor(coordinator),
+        AmtTamperSensor(coordinator),
+        *(AmtZoneBinarySensor(coordinator, zone) for zone in range(1, MAX_ZONES + 1)),
+    )
 
     async_add_entities(entities)
 
 
-class AmtZonesClosedSensor(CoordinatorEntity, BinarySensorEntity):
-    """Representation of an AMT-8000 Zones Closed Sensor."""
+class AmtBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
+    """Base class for AMT-8000 binary sensors."""
 
     def __init__(self, coordinator: AmtCoordinator) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._attr_name = "AMT-8000 All Zones Closed"
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zones_closed"
-        self._attr_device_class = BinarySensorDeviceClass.SAFETY # Clase de dispositivo apropiada
-        self._is_on = None
+        self._attr_device_info = coordinator.device_info
+        self._written: tuple[bool | None, bool] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register the coordinator listener and take the current value."""
+        await super().async_added_to_hass()
+        self._async_store(self._value())
+
+    @abstractmethod
+    def _value(self) -> bool | None:
+        """Return the current value from the coordinator data."""
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._is_on = self.coordinator.data.get("zonesClosed")
-        self.async_write_ha_state()
+        """Write state only if the value or availability changed."""
+        if self._async_store(self._value()):
+            self.async_write_ha_state()
+
+    @callback
+    def _async_store(self, value: bool | None) -> bool:
+        """Store the availability for a value; return True if anything changed."""
+        key = (value, self.coordinator.last_update_success)
+        if key == self._written:
+            return False
+        self._written = key
+        self._attr_available = key[1] and value is not None
+        return True
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        return self._is_on
+        return self._value()
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success and self._is_on is not None
-    
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.config_entry.entry_id)},
-            "name": "AMT-8000 Alarm Panel",
-            "manufacturer": "Intelbras",
-            "model": self.coordinator.data.get("model", "AMT-8000"),
-            "sw_version": self.coordinator.data.get("version", "Unknown"),
-        }
-
-
-class AmtSirenSensor(CoordinatorEntity, BinarySensorEntity):
+        """Return the availability stored on the last update."""
+        # CoordinatorEntity define su propio available, que oculta _attr_available
+        return self._attr_available
+
+
+class AmtPanelBinarySensor(AmtBinarySensorBase):
+    """Binary sensor fed by one key of the panel data."""
+
+    _panel_key: str
+
+    def _value(self) -> bool | None:
+        """Return the panel data value for this sensor."""
+        return self.coordinator.panel_data.get(self._panel_key)
+
+
+class AmtZonesClosedSensor(AmtPanelBinarySensor):
+    """Representation of an AMT-8000 Zones Closed Sensor."""
+
+    _panel_key = "zonesClosed"
+
+    def __init__(self, coordinator: AmtCoordinator) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._attr_name = "AMT-8000 All Zones Closed"
+        self._attr_unique_id = _uid(coordinator.config_entry.entry_id, "_zones_closed")
+        self._attr_device_class = BinarySensorDeviceClass.SAFETY # Clase de dispositivo apropiada
+
+
+class AmtSirenSensor(AmtPanelBinarySensor):
     """Representation of an AMT-8000 Siren Sensor."""
 
+    _panel_key = "siren"
+
     def __init__(self, coordinator: AmtCoordinator) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._attr_name = "AMT-8000 Siren Active"
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_siren_active"
+        self._attr_unique_id = _uid(coordinator.config_entry.entry_id, "_siren_active")
         self._attr_device_class = BinarySensorDeviceClass.SIREN # Clase de dispositivo para sirenas
-        self._is_on = None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._is_on = self.coordinator.data.get("siren")
-        self.async_write_ha_state()
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        return self._is_on
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success and self._is_on is not None
-    
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.config_entry.entry_id)},
-            "name": "AMT-8000 Alarm Panel",
-            "manufacturer": "Intelbras",
-            "model": self.coordinator.data.get("model", "AMT-8000"),
-            "sw_version": self.coordinator.data.get("version", "Unknown"),
-        }
-
-
-class AmtTamperSensor(CoordinatorEntity, BinarySensorEntity):
+class AmtTamperSensor(AmtPanelBinarySensor):
     """Representation of an AMT-8000 Tamper Sensor."""
 
+    _panel_key = "tamper"
+
     def __init__(self, coordinator: AmtCoordinator) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._attr_name = "AMT-8000 Tamper Detected"
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_tamper_detected"
+        self._attr_unique_id = _uid(coordinator.config_entry.entry_id, "_tamper_detected")
         self._attr_device_class = BinarySensorDeviceClass.PROBLEM # Clase de dispositivo para problemas
-        self._is_on = None
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._is_on = self.coordinator.data.get("tamper")
-        self.async_write_ha_state()
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        return self._is_on
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success and self._is_on is not None
-    
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.config_entry.entry_id)},
-            "name": "AMT-8000 Alarm Panel",
-            "manufacturer": "Intelbras",
-            "model": self.coordinator.data.get("model", "AMT-8000"),
-            "sw_version": self.coordinator.data.get("version", "Unknown"),
-        }
 
 
 # NUEVA CLASE PARA LAS ZONAS INDIVIDUALES
-class AmtZoneBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class AmtZoneBinarySensor(AmtBinarySensorBase):
     """Representation of an AMT-8000 Zone Binary Sensor."""
 
     def __init__(self, coordinator: AmtCoordinator, zone_number: int) -> None:
         """Initialize the zone binary sensor."""
         super().__init__(coordinator)
         self._zone_number = zone_number
+        # Bit de esta zona en zones_mask, calculado una sola vez
+        self._zone_bit = 1 << (zone_number - 1)
         self._attr_name = f"AMT-8000 Zone {zone_number}"
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_number}"
+        self._attr_unique_id = _uid(coordinator.config_entry.entry_id, f"_zone_{zone_number}")
         # La clase de dispositivo 'opening' es genérica para sensores de apertura/cierre.
         self._attr_device_class = BinarySensorDeviceClass.OPENING 
-        self._is_on = None # Para almacenar el estado actual de la zona (True = abierto, False = cerrado)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        # El coordinador.data ahora contiene la clave 'zones' que es una lista de booleanos.
-        # El índice de la lista es (zone_number - 1) ya que las listas son 0-indexadas.
-        if (
-            self.coordinator.data 
-            and "zones" in self.coordinator.data 
-            and len(self.coordinator.data["zones"]) >= self._zone_number
-        ):
-            # True si la zona está abierta/faulted, False si está cerrada
-            self._is_on = self.coordinator.data["zones"][self._zone_number - 1]
-        else:
-            LOGGER.warning(f"Zone {self._zone_number} data not found or invalid in coordinator data.")
-            self._is_on = None # Marcar como desconocido si los datos no están disponibles
-        self.async_write_ha_state() # Notifica a Home Assistant de un cambio de estado
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if the binary sensor is on (zone is open/faulted)."""
-        return self._is_on
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # El sensor está disponible si el coordinador está disponible y se pudo obtener el estado de la zona
-        return self.coordinator.last_update_success and self._is_on is not None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        # Asociar este sensor al mismo dispositivo que el panel de alarma
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.config_entry.entry_id)},
-            "name": "AMT-8000 Alarm Panel",
-            "manufacturer": "Intelbras",
-            "model": self.coordinator.data.get("model", "AMT-8000"),
-            "sw_version": self.coordinator.data.get("version", "Unknown"),
-        }
+    def _value(self) -> bool | None:
+        """Return the zone state from the coordinator data."""
+        # El coordinador.data contiene 'zones_mask': el bit (zone_number - 1)
+        # vale 1 si la zona está abierta/faulted y 0 si está cerrada.
+        data = self.coordinator.data
+        if not data or "zones_mask" not in data:
+            # Desconocido si los datos no están disponibles
+            return None
+        return bool(data["zones_mask"] & self._zone_bit)
@@ -7,12 +7,13 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
-from .isec2.client import Client as ISecClient
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .isec2.client import AuthError, Client as ISecClient, CommunicationError
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,15 +25,25 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+async def _async_authenticate(host: str, port: int, password: str) -> bool:
+    """Open a session against the panel and authenticate."""
+    async with ISecClient(host, port) as client:
+        return await client.async_auth(password)
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    client = ISecClient(data["host"], data["port"])
-    client.connect()
-    auth = client.auth(data["password"])
-    client.close()
+    try:
+        auth = await _async_authenticate(
+            data["host"], data["port"], data["password"]
+        )
+    except AuthError as err:
+        raise InvalidAuth from err
+    except CommunicationError as err:
+        raise CannotConnect from err
 
     if auth:
         LOGGER.info("AMT logged in!")
@@ -69,6 +80,43 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Create the options flow."""
+        return OptionsFlowHandler(config_entry)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle AMT-8000 options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        scan_interval = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+        )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
+                        vol.Coerce(int), vol.Range(min=5, max=3600)
+                    ),
+                }
+            ),
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -1,3 +1,6 @@
 """Constants for the AMT-8000 integration."""
 
 DOMAIN = "amt8000"
+
+# Intervalo de sondeo por defecto (segundos), configurable desde las opciones
+DEFAULT_SCAN_INTERVAL = 30
@@ -1,23 +1,53 @@
 import asyncio
+from contextlib import suppress
 import logging
 from datetime import timedelta
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Tuple, TypeVar
 
+import async_timeout
+
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
+
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
 
 from .isec2.client import Client as ISecClient, CommunicationError
 
 LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Datos de panel vacíos y de solo lectura, compartidos mientras no hay datos
+_EMPTY_PANEL: Mapping[str, Any] = MappingProxyType({})
+
+# Bits del entero "flags" de panel_data, empaquetado al decodificar el estado
+FLAG_DISARMED = 1 << 0
+FLAG_ARMED_STAY = 1 << 1
+FLAG_PARTIALLY_ARMED = 1 << 2
+FLAG_ARMED = 1 << 3
+FLAG_IN_ALARM = 1 << 4
+
+# Máximo de comandos encolados que se ejecutan en una misma tanda
+MAX_COMMAND_BATCH = 8
+
+# Tiempo máximo (s) para una tanda de comandos más la lectura de estado
+COMMAND_TIMEOUT = 10
+
 
 class AmtCoordinator(DataUpdateCoordinator):
     """Coordinate the AMT-8000 status updates."""
 
+    client: ISecClient
+    password: str
+    config_entry: ConfigEntry
+
     def __init__(
         self, 
         hass: HomeAssistant, 
@@ -30,30 +60,53 @@ class AmtCoordinator(DataUpdateCoordinator):
             hass,
             LOGGER,
             name="AMT-8000",
-            update_interval=timedelta(seconds=30),
+            update_interval=timedelta(
+                seconds=config_entry.options.get(
+                    CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                )
+            ),
         )
         self.client = client
         self.password = password
         self.config_entry = config_entry
         self._authenticated = False
-        self._paired_zones: Dict[str, bool] = {}
+        # Último estado decodificado; si no cambia se reutiliza self.data tal cual
+        self._last_status: Dict[str, Any] | None = None
+        # Datos y resultado con los que se notificó por última vez a las entidades
+        self._notified: Tuple[Any, bool] | None = None
         self._connection_active = False
+        # Serializa el acceso al socket compartido entre polling y comandos
+        self.command_lock = asyncio.Lock()
+        # Comandos pendientes de ejecutar en la próxima tanda
+        self._pending: List[
+            Tuple[Callable[[ISecClient], Awaitable[Any]], asyncio.Future]
+        ] = []
+        self._batch_task: asyncio.Task | None = None
+        # Información del dispositivo compartida por todas las entidades
+        self._device_key: Tuple[Any, Any] | None = None
+        self._device_info: DeviceInfo | None = None
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from AMT-8000."""
         try:
-            # Conectar y autenticar si es necesario
-            if not self._connection_active:
-                await self._async_ensure_connection()
+            async with self.command_lock:
+                # Conectar y autenticar si es necesario
+                reused = self._connection_active
+                await self.ensure_connected()
 
-            # Obtener zonas emparejadas si no las tenemos
-            if not self._paired_zones:
-                await self._async_get_paired_zones()
+                # Obtener estado del sistema
+                try:
+                    status = await self._async_get_status()
+                except CommunicationError as err:
+                    if not reused:
+                        raise
+                    # La sesión reutilizada pudo caducar: reconectar una vez
+                    LOGGER.debug("Status failed on cached session, reconnecting: %s", err)
+                    self._reset_connection()
+                    await self._async_ensure_connection()
+                    status = await self._async_get_status()
 
-            # Obtener estado del sistema
-            status = await self._async_get_status()
-            
-            return self._process_status_data(status)
+            return self._data_for_status(status)
 
         except CommunicationError as err:
             LOGGER.warning("Communication error with AMT-8000: %s", err)
@@ -68,7 +121,8 @@ class AmtCoordinator(DataUpdateCoordinator):
     async def _async_ensure_connection(self) -> None:
         """Ensure connection and authentication."""
         try:
-            await asyncio.to_thread(self._connect_and_auth)
+            await self.client.async_connect()
+            await self.client.async_auth(self.password)
             self._connection_active = True
             self._authenticated = True
             LOGGER.debug("Connection established with AMT-8000")
@@ -76,38 +130,172 @@ class AmtCoordinator(DataUpdateCoordinator):
             self._reset_connection()
             raise CommunicationError(f"Connection failed: {err}")
 
-    def _connect_and_auth(self) -> None:
-        """Connect and authenticate (sync method for thread)."""
-        self.client.connect()
-        self.client.auth(self.password)
+    async def ensure_connected(self) -> None:
+        """Connect and authenticate only if there is no active session."""
+        if not self._connection_active:
+            await self._async_ensure_connection()
+
+    async def run_command(self, fn: Callable[[ISecClient], Awaitable[_T]]) -> _T:
+        """Queue a client command and wait for its result.
 
-    async def _async_get_paired_zones(self) -> None:
-        """Get paired zones information."""
+        Commands queued while a batch is running are executed together on the
+        shared authenticated session, followed by a single status read that
+        refreshes every listener, so callers do not need to request a refresh.
+        """
+        future: asyncio.Future = self.hass.loop.create_future()
+        self._pending.append((fn, future))
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = self.hass.async_create_task(self._async_drain_commands())
+        return await future
+
+    async def _async_drain_commands(self) -> None:
+        """Execute the queued commands in batches."""
+        while self._pending:
+            batch = self._pending[:MAX_COMMAND_BATCH]
+            del self._pending[:MAX_COMMAND_BATCH]
+
+            # Resultados de los comandos ya ejecutados, en el orden de la tanda
+            results: List[Any] = []
+            status: Dict[str, Any] | None = None
+            error: Exception | None = None
+            try:
+                async with self.command_lock:
+                    # El plazo corre desde que se tiene el lock, no mientras
+                    # se espera a que termine una consulta en curso
+                    async with async_timeout.timeout(COMMAND_TIMEOUT):
+                        status = await self._async_run_batch(
+                            [fn for fn, _ in batch], results
+                        )
+            except asyncio.CancelledError:
+                # Se está cerrando la conexión: la tanda en curso no termina
+                self._resolve_batch(batch, results, CommunicationError("Connection closed"))
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                # La sesión puede haber quedado a mitad de una trama
+                self._reset_connection()
+                error = err
+
+            self._resolve_batch(batch, results, error)
+            if status is not None:
+                self.async_set_updated_data(self._data_for_status(status))
+
+    @staticmethod
+    def _resolve_batch(
+        batch: List[Tuple[Callable[[ISecClient], Awaitable[Any]], asyncio.Future]],
+        results: List[Any],
+        error: Exception | None,
+    ) -> None:
+        """Hand each caller its command result, or the batch error if it has none."""
+        # Los comandos sin resultado no llegaron a enviarse: reciben el error
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            result = results[index] if index < len(results) else error
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _async_run_batch(
+        self, fns: List[Callable[[ISecClient], Awaitable[Any]]], results: List[Any]
+    ) -> Dict[str, Any]:
+        """Run a batch of commands, reconnecting once if the session is stale."""
+        await self.ensure_connected()
         try:
-            LOGGER.info("Retrieving paired zones...")
-            paired_zones = await asyncio.to_thread(self.client.get_paired_sensors)
-            self._paired_zones = paired_zones or {}
-            LOGGER.info(f"Found {len(self._paired_zones)} paired zones")
-        except Exception as err:
-            LOGGER.warning(f"Failed to get paired zones: {err}")
-            self._paired_zones = {}
+            return await self._run_batch(fns, results)
+        except CommunicationError as err:
+            LOGGER.debug("Batch failed on cached session, reconnecting: %s", err)
+            self._reset_connection()
+            await self._async_ensure_connection()
+            # Solo se reintentan los comandos que aún no se enviaron; el que
+            # falló ya tiene su error en results
+            return await self._run_batch(fns, results)
+
+    async def _run_batch(
+        self, fns: List[Callable[[ISecClient], Awaitable[Any]]], results: List[Any]
+    ) -> Dict[str, Any]:
+        """Run pending commands and read the status.
+
+        A command that fails with a communication error may already have
+        reached the panel, so it is not retried: its error is returned to the
+        caller and only the commands after it run on the new session.
+        """
+        for fn in fns[len(results):]:
+            try:
+                results.append(await fn(self.client))
+            except CommunicationError as err:
+                results.append(err)
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                results.append(err)
+        return await self.client.async_status()
 
     async def _async_get_status(self) -> Dict[str, Any]:
         """Get status from AMT-8000."""
         try:
-            return await asyncio.to_thread(self.client.status)
+            return await self.client.async_status()
         except Exception as err:
             raise CommunicationError(f"Failed to get status: {err}")
 
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None], context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates; a failing listener does not stop the others."""
+
+        @callback
+        def _guarded_update() -> None:
+            try:
+                update_callback()
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Error updating AMT-8000 listener %s", update_callback)
+
+        return super().async_add_listener(_guarded_update, context)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners only when the data or the update result changed.
+
+        Equivalent to always_update=False on newer Home Assistant releases:
+        an unchanged status keeps the same data object (see _data_for_status),
+        so a quiet poll does not call back into every entity.
+        """
+        notified = self._notified
+        if (
+            notified is not None
+            and notified[0] is self.data
+            and notified[1] == self.last_update_success
+        ):
+            return
+        self._notified = (self.data, self.last_update_success)
+        super().async_update_listeners()
+
+    def _data_for_status(self, status: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the processed data, reusing the current object if unchanged.
+
+        Entities compare the panel data by identity, so an unchanged status
+        keeps the same objects and their callbacks return early.
+        """
+        # El cliente devuelve el mismo objeto si la trama no cambió
+        if self.data is not None and (
+            status is self._last_status or status == self._last_status
+        ):
+            return self.data
+        self._last_status = status
+        return self._process_status_data(status)
+
     def _process_status_data(self, status: Dict[str, Any]) -> Dict[str, Any]:
         """Process raw status data into structured format."""
-        # Extraer datos del panel
+        # Extraer datos del panel; los flags de armado salen del estado decodificado
+        arm_status = status.get("status", "unknown")
+        siren = status.get("siren", False)
         panel_data = {
-            "armed": status.get("armed", False),
-            "partiallyArmed": status.get("partiallyArmed", False),
-            "disarmed": status.get("disarmed", False),
-            "inAlarm": status.get("inAlarm", False),
+            "armed": arm_status == "armed_away",
+            "partiallyArmed": arm_status == "partial_armed",
+            "disarmed": arm_status == "disarmed",
+            "inAlarm": siren,
             "armedStay": status.get("armedStay", False),
+            "siren": siren,
             "zonesFiring": status.get("zonesFiring", False),
             "zonesClosed": status.get("zonesClosed", False),
             "batteryStatus": status.get("batteryStatus", "unknown"),
@@ -115,62 +303,77 @@ class AmtCoordinator(DataUpdateCoordinator):
             "model": status.get("model", "AMT-8000"),
             "version": status.get("version", "Unknown"),
         }
-
-        # Extraer datos de zonas emparejadas
-        zones_data = {}
-        raw_zones = status.get("zones", {})
-        
-        for zone_id, is_paired in self._paired_zones.items():
-            if is_paired:
-                zones_data[zone_id] = raw_zones.get(zone_id, "normal")
+        panel_data["flags"] = (
+            (FLAG_IN_ALARM if panel_data["inAlarm"] else 0)
+            | (FLAG_ARMED if panel_data["armed"] else 0)
+            | (FLAG_PARTIALLY_ARMED if panel_data["partiallyArmed"] else 0)
+            | (FLAG_ARMED_STAY if panel_data["armedStay"] else 0)
+            | (FLAG_DISARMED if panel_data["disarmed"] else 0)
+        )
 
         return {
             "panel_data": panel_data,
-            "zones_data": zones_data,
+            # Zonas abiertas como máscara de bits: bit (n - 1) = zona n
+            "zones_mask": status.get("zonesMask", 0),
         }
 
     def _reset_connection(self) -> None:
         """Reset connection state."""
         self._connection_active = False
         self._authenticated = False
+        if not self.client.is_connected:
+            return
         try:
             self.client.close()
         except Exception:
             pass  # Ignore cleanup errors
 
-    async def async_refresh_zones(self) -> None:
-        """Manually refresh paired zones information."""
-        try:
-            LOGGER.info("Refreshing paired zones...")
-            await self._async_ensure_connection()
-            await self._async_get_paired_zones()
-            # Trigger data refresh
-            await self.async_refresh()
-            LOGGER.info("Paired zones refreshed successfully")
-        except Exception as err:
-            LOGGER.error(f"Failed to refresh paired zones: {err}")
-            raise
-
     @property
-    def panel_data(self) -> Dict[str, Any]:
+    def panel_data(self) -> Mapping[str, Any]:
         """Get panel data from last update."""
         if not self.data:
-            return {}
-        return self.data.get("panel_data", {})
+            return _EMPTY_PANEL
+        return self.data.get("panel_data") or _EMPTY_PANEL
 
     @property
-    def zones_data(self) -> Dict[str, Any]:
-        """Get zones data from last update."""
-        if not self.data:
-            return {}
-        return self.data.get("zones_data", {})
+    def device_info(self) -> DeviceInfo:
+        """Get the panel device info, rebuilt only when model or version changed."""
+        panel_data = self.panel_data
+        key = (panel_data.get("model"), panel_data.get("version"))
+        if self._device_info is None or key != self._device_key:
+            self._device_key = key
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.config_entry.entry_id)},
+                name="AMT-8000 Alarm Panel",
+                manufacturer="Intelbras",
+                model=key[0] or "AMT-8000",
+                sw_version=key[1] or "Unknown",
+                configuration_url=f"http://{self.config_entry.data['host']}",
+            )
+        return self._device_info
 
-    @property
-    def paired_zones(self) -> Dict[str, bool]:
-        """Get paired zones dictionary."""
-        return self._paired_zones.copy()
+    async def _async_cancel_commands(self) -> None:
+        """Stop the command batches and fail the commands still queued."""
+        task, self._batch_task = self._batch_task, None
+        pending, self._pending = self._pending, []
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(CommunicationError("Connection closed"))
+        if task is not None and not task.done():
+            # La tanda en curso entrega sus resultados o el error al cancelarse
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def async_close(self) -> None:
+        """Close the connection to the panel."""
+        await self._async_cancel_commands()
+        self._connection_active = False
+        self._authenticated = False
+        await self.client.async_close()
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when coordinator is removed."""
+        await self._async_cancel_commands()
         self._reset_connection()
         LOGGER.debug("AMT-8000 coordinator cleaned up")
@@ -1,7 +1,10 @@
 # isec2/client.py
 
+import asyncio
 import socket
 import logging
+import struct
+from enum import IntEnum
 
 LOGGER = logging.getLogger(__name__)
 
@@ -16,14 +19,19 @@ commands = {
     "panic": [0x40, 0x1a]
 }
 
-def split_into_octets(n):
-    """Splits an integer into high and low bytes."""
-    if 0 <= n <= 0xFFFF:
-        high_byte = (n >> 8) & 0xFF
-        low_byte = n & 0xFF
-        return [high_byte, low_byte]
-    else:
-        raise ValueError("Número fora do intervalo (0 a 65535)")
+class _Hex:
+    """Format a buffer as hex only when a log record is actually emitted."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return bytes(self.data).hex()
+
+# Campo de longitud de la trama: entero de 16 bits big-endian en los bytes 4-5
+LENGTH = struct.Struct(">H")
 
 def calculate_checksum(buffer):
     """Calculate a checksum for a given array of bytes."""
@@ -34,9 +42,111 @@ def calculate_checksum(buffer):
     checksum &= 0xFF
     return checksum
 
-def merge_octets(buf):
-    """Merge octets."""
-    return buf[0] * 256 + buf[1]
+def build_frame(command, data=()):
+    """Build a framed request (header, command, data and checksum)."""
+    # Un único bytearray, sin listas intermedias
+    frame = bytearray(dst_id)
+    frame += bytes(our_id)
+    frame += LENGTH.pack(len(command) + len(data))
+    frame += bytes(command)
+    frame += bytes(data)
+    frame.append(calculate_checksum(frame))
+    return bytes(frame)
+
+def frame_prefix(command, data_length):
+    """Return the constant part of a command frame and its XOR."""
+    prefix = bytes(dst_id + our_id) + LENGTH.pack(len(command) + data_length) + bytes(command)
+    return prefix, calculate_checksum(prefix) ^ 0xFF
+
+# Tramas constantes precalculadas al importar: la de estado es siempre igual y
+# las de armado/pánico solo cambian en los últimos bytes
+STATUS_FRAME = build_frame(commands["status"])
+_ARM_DISARM_PREFIX, _ARM_DISARM_XOR = frame_prefix(commands["arm_disarm"], 2)
+_PANIC_PREFIX, _PANIC_XOR = frame_prefix(commands["panic"], 1)
+_AUTH_PREFIX, _AUTH_XOR = frame_prefix(commands["auth"], 8)
+
+# Prefijo constante seguido de los bytes variables y el checksum, en un solo pack
+_ARM_DISARM_FRAME = struct.Struct(f">{len(_ARM_DISARM_PREFIX)}s3B")
+_PANIC_FRAME = struct.Struct(f">{len(_PANIC_PREFIX)}s2B")
+
+def arm_disarm_frame(partition, arm):
+    """Build an arm (1) or disarm (0) frame for a partition."""
+    if partition == 0:
+        partition = 0xFF
+    return _ARM_DISARM_FRAME.pack(
+        _ARM_DISARM_PREFIX, partition, arm, _ARM_DISARM_XOR ^ partition ^ arm ^ 0xFF
+    )
+
+def panic_frame(panic_type):
+    """Build a panic frame."""
+    return _PANIC_FRAME.pack(_PANIC_PREFIX, panic_type, _PANIC_XOR ^ panic_type ^ 0xFF)
+
+def auth_frame(device_type, password, software_version):
+    """Build the authentication frame."""
+    frame = bytearray(_AUTH_PREFIX)
+    frame.append(device_type)
+    frame += password_digits(password)
+    frame.append(software_version)
+    # Solo se pliegan los bytes variables sobre el XOR precalculado del prefijo
+    checksum = _AUTH_XOR
+    for value in memoryview(frame)[len(_AUTH_PREFIX):]:
+        checksum ^= value
+    frame.append(checksum ^ 0xFF)
+    return bytes(frame)
+
+def password_digits(password):
+    """Convert a 6 digit password into the digit bytes sent on auth."""
+    if len(password) != 6 or not password.isascii() or not password.isdigit():
+        raise CommunicationError(
+            "Cannot parse password, only 6 integers long are accepted"
+        )
+    return bytes(char - 0x30 for char in password.encode("ascii"))
+
+# Códigos de rechazo de la autenticación
+AUTH_ERRORS = {
+    1: "Invalid password",
+    2: "Incorrect software version",
+    3: "Alarm panel will call back",
+    4: "Waiting for user permission",
+}
+
+def auth_result(return_data):
+    """Interpret an authentication response."""
+    if len(return_data) < 9:
+        raise CommunicationError(f"Authentication response too short. Length: {len(return_data)}. Raw: {return_data.hex()}")
+
+    result = return_data[8]
+
+    if result == 0:
+        LOGGER.info("Authentication successful.")
+        return True
+    message = AUTH_ERRORS.get(result)
+    if message is not None:
+        raise AuthError(message)
+    raise CommunicationError(f"Unknown payload response for authentication: 0x{result:02x}")
+
+def arm_disarm_result(return_data, done, failed, action):
+    """Interpret an arm or disarm response."""
+    if len(return_data) > 8 and return_data[8] == 0x91:
+        LOGGER.info("System %s successfully.", action)
+        return done
+
+    LOGGER.warning("%s command failed. Response: %s", action.capitalize(), _Hex(return_data))
+    return failed
+
+def panic_result(return_data):
+    """Interpret a panic response."""
+    if len(return_data) > 7 and return_data[7] == 0xfe:
+        LOGGER.info("Panic alarm triggered.")
+        return ArmResult.TRIGGERED
+
+    LOGGER.warning("Panic command failed. Response: %s", _Hex(return_data))
+    return ArmResult.NOT_TRIGGERED
+
+# Códigos de batería (byte 134) y de armado (bits 5-6 del byte 20), indexados
+# por el código; el armado ocupa 2 bits y el código 2 no corresponde a ninguno
+BATTERY_STATUS = ("unknown", "dead", "low", "middle", "full")
+ARM_STATUS = ("disarmed", "partial_armed", "unknown", "armed_away")
 
 def battery_status_for(resp):
     """Retrieve the battery status."""
@@ -45,16 +155,7 @@ def battery_status_for(resp):
         LOGGER.debug("Payload too short for battery status. Length: %d", len(resp))
         return "unknown"
     batt = resp[134]
-    if batt == 0x01:
-        return "dead"
-    if batt == 0x02:
-        return "low"
-    if batt == 0x03:
-        return "middle"
-    if batt == 0x04:
-        return "full"
-    LOGGER.debug("Unknown battery status code: 0x%02x", batt)
-    return "unknown"
+    return BATTERY_STATUS[batt] if batt < len(BATTERY_STATUS) else "unknown"
 
 def get_status(payload):
     """Retrieve the current status from a given array of bytes."""
@@ -62,146 +163,148 @@ def get_status(payload):
     if len(payload) <= 20:
         LOGGER.debug("Payload too short for general status. Length: %d", len(payload))
         return "unknown"
-    status = (payload[20] >> 5) & 0x03
-    if status == 0x00:
-        return "disarmed"
-    if status == 0x01:
-        return "partial_armed"
-    if status == 0x03:
-        return "armed_away"
-    LOGGER.debug("Unknown arming status code: 0x%02x", status)
-    return "unknown"
+    return ARM_STATUS[(payload[20] >> 5) & 0x03]
 
 # NUEVA FUNCIÓN: Obtener estado de las zonas
-def get_zones_status_from_payload(payload: bytearray, num_zones: int = 64) -> list[bool]:
+def get_zones_mask_from_payload(payload: bytearray, num_zones: int = 64) -> int:
     """
-    Decodes the zone status from the payload.
+    Decodes the zone status from the payload as an integer bitmask.
     The zone status bytes start at index 22 in the status payload.
-    Each bit represents a zone (0 = closed, 1 = open/faulted).
+    Bit (n - 1) of the result is zone n (0 = closed, 1 = open/faulted).
     """
-    zones_status = [False] * num_zones
     # Los bytes de estado de las zonas van del índice 22 al 29 para 64 zonas.
-    # Cada byte contiene 8 zonas.
+    # Cada byte contiene 8 zonas, la zona de menor número en el bit menos
+    # significativo; leídos en little-endian quedan como una sola máscara.
     # El fork de Fabiolopez90 usa los bytes 22 a 29.
     # Byte 22: Zonas 1-8
     # Byte 23: Zonas 9-16
     # ...
     # Byte 29: Zonas 57-64
-
-    # Asegurarse de que el payload tenga al menos los bytes necesarios para las zonas
-    # El byte 22 es para la Zona 1, hasta el byte 22 + (num_zones / 8) - 1
-    # Por ejemplo, para 64 zonas, se necesitan (64/8) = 8 bytes, desde el índice 22 hasta el 29 (inclusive).
     required_bytes_for_zones = (num_zones + 7) // 8 # Redondeo hacia arriba para bytes
-    
+
     if len(payload) < 22 + required_bytes_for_zones:
-        LOGGER.warning(f"Payload too short to decode all {num_zones} zones. Required at least {22 + required_bytes_for_zones} bytes, got {len(payload)}.")
+        LOGGER.warning("Payload too short to decode all %d zones. Required at least %d bytes, got %d.", num_zones, 22 + required_bytes_for_zones, len(payload))
         # Decodificar solo las zonas para las que hay datos
-        bytes_to_process = payload[22:]
-    else:
-        bytes_to_process = payload[22 : 22 + required_bytes_for_zones]
-
-    zone_index = 0
-    for byte_val in bytes_to_process:
-        for bit_index in range(8):
-            if zone_index < num_zones:
-                # Si el bit es 1, la zona está abierta (faulted). Si es 0, está cerrada.
-                zones_status[zone_index] = bool(byte_val & (1 << bit_index))
-                zone_index += 1
-            else:
-                break # Ya decodificamos todas las zonas solicitadas
-        if zone_index >= num_zones:
-            break
-
-    LOGGER.debug(f"Decoded zones status: {zones_status}")
+
+    mask = int.from_bytes(payload[22 : 22 + required_bytes_for_zones], "little")
+    return mask & ((1 << num_zones) - 1)
+
+def get_zones_status_from_payload(payload: bytearray, num_zones: int = 64) -> list[bool]:
+    """
+    Decodes the zone status from the payload as one boolean per zone.
+    Each bit represents a zone (0 = closed, 1 = open/faulted).
+    """
+    mask = get_zones_mask_from_payload(payload, num_zones)
+    zones_status = [False] * num_zones
+    # Solo se recorren los bits encendidos: sin zonas abiertas no hay vueltas
+    while mask:
+        lowest = mask & -mask
+        zones_status[lowest.bit_length() - 1] = True
+        mask ^= lowest
+    LOGGER.debug("Decoded zones status: %s", zones_status)
     return zones_status
 
 
+# Estado devuelto cuando la trama no alcanza a traer el payload
+DEFAULT_STATUS = {
+    "model": "Unknown",
+    "version": "Unknown",
+    "status": "unknown",
+    "zonesFiring": False,
+    "zonesClosed": False,
+    "siren": False,
+    "batteryStatus": "unknown",
+    "tamper": False,
+    "zonesMask": 0, # Todas las zonas cerradas
+}
+
 # --- build_status mejorado para manejar el payload completo y robustez ---
 def build_status(data):
     """Build the amt-8000 status from a given array of bytes."""
     if len(data) < 8:
-        LOGGER.error("Received status data is too short (less than 8 bytes). Data: %s", data.hex())
-        return {
-            "model": "Unknown",
-            "version": "Unknown",
-            "status": "unknown",
-            "zonesFiring": False,
-            "zonesClosed": False,
-            "siren": False,
-            "batteryStatus": "unknown",
-            "tamper": False,
-            "zones": [False] * 64, # Inicializar con 64 zonas cerradas
-        }
+        LOGGER.error("Received status data is too short (less than 8 bytes). Data: %s", _Hex(data))
+        return dict(DEFAULT_STATUS)
 
     # El campo de longitud del paquete se encuentra en los bytes 4 y 5
-    length_bytes = data[4:6]
-    if len(length_bytes) < 2:
-        LOGGER.error("Length bytes are missing or insufficient in status data. Data: %s", data.hex())
-        return {
-            "model": "Unknown",
-            "version": "Unknown",
-            "status": "unknown",
-            "zonesFiring": False,
-            "zonesClosed": False,
-            "siren": False,
-            "batteryStatus": "unknown",
-            "tamper": False,
-            "zones": [False] * 64, # Inicializar con 64 zonas cerradas
-        }
-
-    expected_payload_length = merge_octets(data[4:6])
-
-    if len(data) < 8 + expected_payload_length:
+    (expected_payload_length,) = LENGTH.unpack_from(data, 4)
+
+    # La longitud cuenta el comando (2 bytes) y los datos; falta algo solo si
+    # no llegaron todos los datos tras la cabecera de 6 bytes
+    if len(data) < 6 + expected_payload_length:
         LOGGER.warning("Received data is shorter than indicated length. Expected: %d, Received: %d. Data: %s",
-                       8 + expected_payload_length, len(data), data.hex())
-        payload = data[8:]
+                       6 + expected_payload_length, len(data), _Hex(data))
+        payload = memoryview(data)[8:]
     else:
-        payload = data[8 : 8 + expected_payload_length]
+        # Vista sobre la trama: se lee el payload sin copiarlo; termina donde
+        # indica la longitud, sin el checksum
+        payload = memoryview(data)[8 : 6 + expected_payload_length]
 
-    LOGGER.debug("Raw payload for status: %s", payload.hex())
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Raw payload for status: %s", payload.hex())
 
     status_data = {}
+    # Longitud leída una sola vez para todas las comprobaciones
+    size = len(payload)
 
     # Decodificación del modelo
     status_data["model"] = "Unknown"
-    if len(payload) > 0:
+    if size > 0:
         status_data["model"] = "AMT-8000" if payload[0] == 1 else "Unknown"
 
     # Decodificación de la versión
     status_data["version"] = "Unknown"
-    if len(payload) > 3:
-        status_data["version"] = f"{payload[1]}.{payload[2]}.{payload[3]}"
+    if size > 3:
+        status_data["version"] = "%d.%d.%d" % struct.unpack_from("3B", payload, 1)
     
     # Decodificación del estado general y bits de zonas/sirena
     status_data["status"] = "unknown"
     status_data["zonesFiring"] = False
     status_data["zonesClosed"] = False
     status_data["siren"] = False
-    if len(payload) > 20:
-        status_data["status"] = get_status(payload)
-        status_data["zonesFiring"] = (payload[20] & 0x8) > 0
-        status_data["zonesClosed"] = (payload[20] & 0x4) > 0
-        status_data["siren"] = (payload[20] & 0x2) > 0
+    if size > 20:
+        general = payload[20]
+        status_data["status"] = ARM_STATUS[(general >> 5) & 0x03]
+        status_data["zonesFiring"] = bool(general & 0x8)
+        status_data["zonesClosed"] = bool(general & 0x4)
+        status_data["siren"] = bool(general & 0x2)
     else:
-        LOGGER.debug("Payload too short for full status bits. Length: %d", len(payload))
+        LOGGER.debug("Payload too short for full status bits. Length: %d", size)
 
     # Decodificación del estado de la batería
-    status_data["batteryStatus"] = battery_status_for(payload)
+    status_data["batteryStatus"] = "unknown"
+    if size > 134:
+        batt = payload[134]
+        if batt < len(BATTERY_STATUS):
+            status_data["batteryStatus"] = BATTERY_STATUS[batt]
+    else:
+        LOGGER.debug("Payload too short for battery status. Length: %d", size)
 
     # Decodificación del tamper
     status_data["tamper"] = False
-    if len(payload) > 71:
-        status_data["tamper"] = (payload[71] & (1 << 0x01)) > 0
+    if size > 71:
+        status_data["tamper"] = bool(payload[71] & 0x02)
     else:
-        LOGGER.debug("Payload too short for tamper status. Length: %d", len(payload))
+        LOGGER.debug("Payload too short for tamper status. Length: %d", size)
 
     # AÑADIR DECODIFICACIÓN DE ZONAS AQUÍ
-    status_data["zones"] = get_zones_status_from_payload(payload)
+    # Máscara de zonas abiertas: bit (n - 1) = zona n
+    status_data["zonesMask"] = get_zones_mask_from_payload(payload)
 
     LOGGER.debug("Decoded status: %s", status_data)
     return status_data
 
 
+class ArmResult(IntEnum):
+    """Result of an arm, disarm or panic command."""
+
+    NOT_ARMED = 0
+    ARMED = 1
+    NOT_DISARMED = 2
+    DISARMED = 3
+    NOT_TRIGGERED = 4
+    TRIGGERED = 5
+
+
 class CommunicationError(Exception):
     """Exception raised for communication error."""
 
@@ -221,18 +324,74 @@ class AuthError(Exception):
 
 
 class Client:
-    """Client to communicate with amt-8000."""
+    """Client to communicate with amt-8000.
 
-    def __init__(self, host, port, device_type=1, software_version=0x10):
+    The blocking methods use a plain socket; the ``async_*`` methods use an
+    asyncio stream so they can run on the event loop without an executor.
+    """
+
+    def __init__(self, host, port, device_type=1, software_version=0x10, password=None):
         """Initialize the client."""
         self.host = host
         self.port = port
         self.device_type = device_type
         self.software_version = software_version
+        self.password = password
         self.client = None
+        self._reader = None
+        self._writer = None
+        # Última trama de estado y su decodificación, para no repetir el parseo
+        self._last_status_frame = None
+        self._last_status = None
+
+    def __enter__(self):
+        """Open a session, authenticating when a password was given."""
+        self.connect()
+        if self.password is not None:
+            try:
+                self.auth(self.password)
+            except Exception:
+                self.close()
+                raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Release the socket opened by __enter__."""
+        try:
+            self.close()
+        except CommunicationError as e:
+            LOGGER.debug("Error closing session: %s", e)
+        return False
+
+    async def __aenter__(self):
+        """Open an asyncio session, authenticating when a password was given."""
+        await self.async_connect()
+        if self.password is not None:
+            try:
+                await self.async_auth(self.password)
+            except Exception:
+                await self.async_close()
+                raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Release the stream opened by __aenter__."""
+        await self.async_close()
+        return False
+
+    @property
+    def is_connected(self):
+        """Return True while a socket or asyncio stream is open."""
+        return self.client is not None or self._writer is not None
 
     def close(self):
         """Close a connection."""
+        if self._writer is not None:
+            # Cierre inmediato del transporte asyncio; async_close espera el cierre
+            self._writer.close()
+            self._reader = self._writer = None
+            return
+
         if self.client is None:
             LOGGER.warning("Attempted to close a non-existent client connection.")
             return
@@ -252,6 +411,8 @@ class Client:
 
         self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.client.settimeout(timeout)
+        # Tramas cortas de pregunta/respuesta: desactivar Nagle evita esperas
+        self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         LOGGER.debug("Connecting to %s:%d", self.host, self.port)
         try:
             self.client.connect((self.host, self.port))
@@ -263,168 +424,174 @@ class Client:
         except OSError as e:
             raise CommunicationError(f"OS error connecting to {self.host}:{self.port}: {e}")
 
-    def auth(self, password):
-        """Create a authentication for the current connection."""
+    def _request(self, payload, name):
+        """Send a frame on the socket and return the raw response."""
         if self.client is None:
             raise CommunicationError("Client not connected. Call Client.connect first.")
 
-        pass_array = []
-        for char in password:
-            if len(password) != 6 or not char.isdigit():
-                raise CommunicationError(
-                    "Cannot parse password, only 6 integers long are accepted"
-                )
-            pass_array.append(int(char))
-
-        length = [0x00, 0x0a]
-        data = (
-            dst_id
-            + our_id
-            + length
-            + commands["auth"]
-            + [self.device_type]
-            + pass_array
-            + [self.software_version]
-        )
-
-        cs = calculate_checksum(data)
-        payload = bytes(data + [cs])
-
-        LOGGER.debug("Sending authentication: %s", payload.hex())
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Sending %s command: %s", name, payload.hex())
         try:
-            self.client.send(payload)
-            return_data = bytearray(self.client.recv(1024))
+            self.client.sendall(payload)
+            return_data = self._read_frame(name)
         except socket.timeout:
-            raise CommunicationError("Authentication response timed out.")
+            raise CommunicationError(f"{name.capitalize()} command response timed out.")
         except OSError as e:
-            raise CommunicationError(f"OS error during authentication: {e}")
+            raise CommunicationError(f"OS error during {name} command: {e}")
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Raw %s response: %s", name, return_data.hex())
+        return return_data
+
+    def _recv_into(self, view, name):
+        """Fill a memoryview from the socket, failing if the peer closes."""
+        while view:
+            received = self.client.recv_into(view)
+            if not received:
+                raise CommunicationError(f"Connection closed during {name} command.")
+            view = view[received:]
+
+    def _read_frame(self, name):
+        """Read one complete response frame from the socket."""
+        # Cabecera (destino, origen, longitud) y luego el resto de la trama
+        header = bytearray(6)
+        self._recv_into(memoryview(header), name)
+        frame = bytearray(6 + LENGTH.unpack_from(header, 4)[0] + 1)
+        view = memoryview(frame)
+        view[:6] = header
+        self._recv_into(view[6:], name)
+        return frame
 
-        LOGGER.debug("Raw authentication response: %s", return_data.hex())
+    def auth(self, password):
+        """Create a authentication for the current connection."""
+        frame = auth_frame(self.device_type, password, self.software_version)
+        return auth_result(self._request(frame, "authentication"))
 
-        if len(return_data) < 9:
-            raise CommunicationError(f"Authentication response too short. Length: {len(return_data)}. Raw: {return_data.hex()}")
+    def status(self):
+        """Return the current status."""
+        return self._status_for(self._request(STATUS_FRAME, "status"))
 
-        result = return_data[8:9][0]
+    def arm_system(self, partition):
+        """Arm the system for a given partition."""
+        return arm_disarm_result(
+            self._request(arm_disarm_frame(partition, 0x01), "arm"),
+            ArmResult.ARMED, ArmResult.NOT_ARMED, "armed",
+        )
 
-        if result == 0:
-            LOGGER.info("Authentication successful.")
-            return True
-        if result == 1:
-            raise AuthError("Invalid password")
-        if result == 2:
-            raise AuthError("Incorrect software version")
-        if result == 3:
-            raise AuthError("Alarm panel will call back")
-        if result == 4:
-            raise AuthError("Waiting for user permission")
-        raise CommunicationError(f"Unknown payload response for authentication: 0x{result:02x}")
+    def disarm_system(self, partition):
+        """Disarm the system for a given partition."""
+        return arm_disarm_result(
+            self._request(arm_disarm_frame(partition, 0x00), "disarm"),
+            ArmResult.DISARMED, ArmResult.NOT_DISARMED, "disarmed",
+        )
 
-    def status(self):
-        """Return the current status."""
-        if self.client is None:
-            raise CommunicationError("Client not connected. Call Client.connect first.")
+    def panic(self, panic_type):
+        """Trigger a panic alarm."""
+        return panic_result(self._request(panic_frame(panic_type), "panic"))
 
-        length = [0x00, 0x02]
-        status_data = dst_id + our_id + length + commands["status"]
-        cs = calculate_checksum(status_data)
-        payload = bytes(status_data + [cs])
+    async def async_connect(self):
+        """Create a new asyncio connection."""
+        if self._writer is not None or self.client is not None:
+            self.close()
 
-        LOGGER.debug("Sending status command: %s", payload.hex())
+        LOGGER.debug("Connecting to %s:%d", self.host, self.port)
         try:
-            self.client.send(payload)
-            return_data = bytearray(self.client.recv(1024))
-        except socket.timeout:
-            raise CommunicationError("Status command response timed out.")
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout
+            )
+        except asyncio.TimeoutError:
+            raise CommunicationError(f"Connection timed out to {self.host}:{self.port}")
+        except ConnectionRefusedError:
+            raise CommunicationError(f"Connection refused by {self.host}:{self.port}")
         except OSError as e:
-            raise CommunicationError(f"OS error during status command: {e}")
+            raise CommunicationError(f"OS error connecting to {self.host}:{self.port}: {e}")
 
-        LOGGER.debug("Raw status response (full): %s", return_data.hex())
-        status = build_status(return_data)
-        return status
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            # Tramas cortas de pregunta/respuesta: desactivar Nagle evita esperas
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        LOGGER.debug("Connection established.")
 
-    def arm_system(self, partition):
-        """Arm the system for a given partition."""
-        if self.client is None:
-            raise CommunicationError("Client not connected. Call Client.connect first.")
+    async def async_close(self):
+        """Close the asyncio connection and wait until it is closed."""
+        writer = self._writer
+        if writer is None:
+            self.close()
+            return
 
-        if partition == 0:
-            partition = 0xFF
+        self.close()
+        try:
+            await writer.wait_closed()
+        except OSError as e:
+            LOGGER.debug("Error closing stream: %s", e)
 
-        length = [0x00, 0x04]
-        arm_data = dst_id + our_id + length + commands["arm_disarm"] + [ partition, 0x01 ]
-        cs = calculate_checksum(arm_data)
-        payload = bytes(arm_data + [cs])
+    async def _async_request(self, payload, name):
+        """Send a frame on the stream and read one complete response frame."""
+        if self._writer is None:
+            raise CommunicationError("Client not connected. Call Client.async_connect first.")
 
-        LOGGER.debug("Sending arm command: %s", payload.hex())
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Sending %s command: %s", name, payload.hex())
         try:
-            self.client.send(payload)
-            return_data = bytearray(self.client.recv(1024))
-        except socket.timeout:
-            raise CommunicationError("Arm command response timed out.")
+            self._writer.write(payload)
+            await self._writer.drain()
+            # Cabecera (destino, origen, longitud) y luego el resto de la trama
+            header = await asyncio.wait_for(self._reader.readexactly(6), timeout)
+            body = await asyncio.wait_for(
+                self._reader.readexactly(LENGTH.unpack_from(header, 4)[0] + 1), timeout
+            )
+        except asyncio.TimeoutError:
+            raise CommunicationError(f"{name.capitalize()} command response timed out.")
+        except asyncio.IncompleteReadError as e:
+            raise CommunicationError(f"Connection closed during {name} command: {e}")
         except OSError as e:
-            raise CommunicationError(f"OS error during arm command: {e}")
+            raise CommunicationError(f"OS error during {name} command: {e}")
 
-        LOGGER.debug("Raw arm response: %s", return_data.hex())
-        if len(return_data) > 8 and return_data[8] == 0x91:
-            LOGGER.info("System armed successfully.")
-            return 'armed'
-        
-        LOGGER.warning("Arm command failed. Response: %s", return_data.hex())
-        return 'not_armed'
+        return_data = header + body
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Raw %s response: %s", name, return_data.hex())
+        return return_data
 
-    def disarm_system(self, partition):
-        """Disarm the system for a given partition."""
-        if self.client is None:
-            raise CommunicationError("Client not connected. Call Client.connect first.")
+    async def async_auth(self, password):
+        """Authenticate the current asyncio connection."""
+        frame = auth_frame(self.device_type, password, self.software_version)
+        return auth_result(await self._async_request(frame, "authentication"))
 
-        if partition == 0:
-            partition = 0xFF
-
-        length = [0x00, 0x04]
-        arm_data = dst_id + our_id + length + commands["arm_disarm"] + [ partition, 0x00 ]
-        cs = calculate_checksum(arm_data)
-        payload = bytes(arm_data + [cs])
+    async def async_status(self):
+        """Return the current status."""
+        return self._status_for(
+            await self._async_request(STATUS_FRAME, "status")
+        )
 
-        LOGGER.debug("Sending disarm command: %s", payload.hex())
-        try:
-            self.client.send(payload)
-            return_data = bytearray(self.client.recv(1024))
-        except socket.timeout:
-            raise CommunicationError("Disarm command response timed out.")
-        except OSError as e:
-            raise CommunicationError(f"OS error during disarm command: {e}")
+    async def async_arm_system(self, partition):
+        """Arm the system for a given partition."""
+        return arm_disarm_result(
+            await self._async_request(arm_disarm_frame(partition, 0x01), "arm"),
+            ArmResult.ARMED, ArmResult.NOT_ARMED, "armed",
+        )
 
-        LOGGER.debug("Raw disarm response: %s", return_data.hex())
-        if len(return_data) > 8 and return_data[8] == 0x91:
-            LOGGER.info("System disarmed successfully.")
-            return 'disarmed'
-        
-        LOGGER.warning("Disarm command failed. Response: %s", return_data.hex())
-        return 'not_disarmed'
+    async def async_disarm_system(self, partition):
+        """Disarm the system for a given partition."""
+        return arm_disarm_result(
+            await self._async_request(arm_disarm_frame(partition, 0x00), "disarm"),
+            ArmResult.DISARMED, ArmResult.NOT_DISARMED, "disarmed",
+        )
 
-    def panic(self, panic_type):
+    async def async_panic(self, panic_type):
         """Trigger a panic alarm."""
-        if self.client is None:
-            raise CommunicationError("Client not connected. Call Client.connect first.")
+        return panic_result(
+            await self._async_request(panic_frame(panic_type), "panic")
+        )
 
-        length = [0x00, 0x03]
-        panic_data = dst_id + our_id + length + commands["panic"] +[ panic_type ]
-        cs = calculate_checksum(panic_data)
-        payload = bytes(panic_data + [cs])
+    def _status_for(self, return_data):
+        """Decode a status frame, reusing the last result for identical bytes.
 
-        LOGGER.debug("Sending panic command: %s", payload.hex())
-        try:
-            self.client.send(payload)
-            return_data = bytearray(self.client.recv(1024))
-        except socket.timeout:
-            raise CommunicationError("Panic command response timed out.")
-        except OSError as e:
-            raise CommunicationError(f"OS error during panic command: {e}")
-
-        LOGGER.debug("Raw panic response: %s", return_data.hex())
-        if len(return_data) > 7 and return_data[7] == 0xfe:
-            LOGGER.info("Panic alarm triggered.")
-            return 'triggered'
-        
-        LOGGER.warning("Panic command failed. Response: %s", return_data.hex())
-        return 'not_triggered'
+        The returned dict is shared between identical frames; callers must not
+        modify it.
+        """
+        if return_data == self._last_status_frame:
+            return self._last_status
+        status = build_status(return_data)
+        self._last_status_frame = return_data
+        self._last_status = status
+        return status